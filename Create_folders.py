@@ -13,11 +13,17 @@
 # =============================================================================
 
 # ============================= 01. IMPORTS ===================================
+import os
 import sys
 import re
+import stat
+import struct
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import tkinter as tk
-from tkinter import messagebox, Checkbutton, IntVar
+from tkinter import messagebox
 from tkinter import ttk
 BASE_DIR = Path(__file__).resolve().parent
 print("SCRIPT LOCATION :", BASE_DIR)
@@ -29,36 +35,124 @@ print("ICONS EXISTS? :", (BASE_DIR / "icons").exists())
 try:
     from PIL import Image, ImageTk
     PIL_AVAILABLE = True
+    RESAMPLE = getattr(Image, "Resampling", Image).LANCZOS
 except Exception:
     PIL_AVAILABLE = False
 
-def create_folder(path: Path):
-    """Create a folder (and parents) with error handling."""
+# Validation patterns (compiled once)
+_NAME_RE = re.compile(r"^([A-Za-z])\-([A-Za-z0-9][A-Za-z0-9\- _]*)$")
+_META_RE = re.compile(r"^(\d{4})\-([A-Za-zÀ-ÖØ-öø-ÿ][A-Za-zÀ-ÖØ-öø-ÿ\s\-\.\']*)$")
+_DRIVE_RE = re.compile(r"^[A-Za-z]$")
+
+# Per-folder console output (slow on Windows consoles); FOLDER_CREATOR_DEBUG=1 to enable
+DEBUG = os.environ.get("FOLDER_CREATOR_DEBUG", "").strip().lower() in {"1", "true", "yes"}
+
+# Folder creation runs on worker threads; independent section subtrees in parallel
+MAX_WORKERS = 8
+POLL_MS = 50
+
+def ask_continue_on_error(path: Path, error: Exception) -> bool:
+    """Default error prompt (main thread only)."""
+    return messagebox.askyesno("Error", f"Error creating folder:\n{path}\n{error}\n\nContinue?")
+
+# POSIX: create folders relative to already-open parent directories, so the
+# full path is not resolved again for every mkdir. Windows has no dir_fd.
+USE_DIR_FD = (os.mkdir in os.supports_dir_fd and os.open in os.supports_dir_fd
+              and hasattr(os, "O_DIRECTORY"))
+DIR_OPEN_FLAGS = os.O_RDONLY | getattr(os, "O_DIRECTORY", 0)
+
+def _mkdir_exist_ok(name: str, parent_fd: int):
     try:
-        path.mkdir(parents=True, exist_ok=True)
-        print("Folder created:", path)
+        os.mkdir(name, dir_fd=parent_fd)
+    except FileExistsError:
+        if not stat.S_ISDIR(os.stat(name, dir_fd=parent_fd).st_mode):
+            raise
+
+def _open_dir_at(path: Path, dir_fds: dict) -> int:
+    """Return an fd for path, creating it through its (cached) parent fd if needed."""
+    fd = dir_fds.get(path)
+    if fd is None:
+        if path.parent == path:
+            raise FileNotFoundError(f"No open ancestor directory for {path}")
+        parent_fd = _open_dir_at(path.parent, dir_fds)
+        _mkdir_exist_ok(path.name, parent_fd)
+        fd = os.open(path.name, DIR_OPEN_FLAGS, dir_fd=parent_fd)
+        dir_fds[path] = fd
+    return fd
+
+def create_folder(path: Path, ask_continue=ask_continue_on_error, dir_fds=None, created=None) -> bool:
+    """Create a folder (and parents) with error handling.
+
+    With dir_fds ({Path: fd} of open ancestors), the folder is created relative
+    to them instead of by full path. Successfully created paths are appended to
+    created. Returns False if the user chose to stop after an error.
+    """
+    try:
+        if dir_fds is None:
+            path.mkdir(parents=True, exist_ok=True)
+        elif path not in dir_fds:
+            _mkdir_exist_ok(path.name, _open_dir_at(path.parent, dir_fds))
+        if DEBUG:
+            print("Folder created:", path)
+        if created is not None:
+            created.append(path)
     except OSError as e:
         print(f"Error creating folder: {path}\n{e}")
-        proceed = messagebox.askyesno("Error", f"Error creating folder:\n{path}\n{e}\n\nContinue?")
-        if not proceed:
-            sys.exit(1)
+        return ask_continue(path, e)
+    return True
 
 
 # =========================== 02. GENERIC HELPERS =============================
-def load_icon(icon_path: Path, size=(20, 20)):
-    if not icon_path.exists():
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+def _png_size(icon_path: Path):
+    """Read (width, height) from the PNG header without decoding the image."""
+    try:
+        with open(icon_path, "rb") as f:
+            head = f.read(24)
+    except OSError:
+        return None
+    if len(head) < 24 or not head.startswith(_PNG_SIGNATURE):
+        return None
+    return struct.unpack(">II", head[16:24])
+
+def list_icon_files(icons_dir: Path):
+    """One directory listing for all icons ({casefolded name: actual name}), or None if unreadable."""
+    try:
+        return {name.casefold(): name for name in os.listdir(icons_dir)}
+    except OSError:
+        return None
+
+def load_icon(icon_path: Path, size=(20, 20), icon_files=None):
+    if icon_files is not None:
+        # Case-insensitive on every platform; open the file under its real name
+        actual_name = icon_files.get(icon_path.name.casefold())
+        found = actual_name is not None
+        if found:
+            icon_path = icon_path.with_name(actual_name)
+    else:
+        found = icon_path.exists()
+    if not found:
         print("❌ ICON NOT FOUND:", icon_path)
         return None
 
     if not PIL_AVAILABLE:
+        # Tk decodes PNG natively, but cannot resize; usable only at the exact size
+        if _png_size(icon_path) == tuple(size):
+            try:
+                icon = tk.PhotoImage(file=str(icon_path))
+                print("✅ ICON LOADED:", icon_path.name)
+                return icon
+            except tk.TclError as e:
+                print("❌ ICON LOAD ERROR:", icon_path.name, e)
+                return None
         print("⚠️ PIL not available, icon skipped:", icon_path.name)
         return None
 
     try:
-        from PIL import Image
-        resample = getattr(Image, "Resampling", Image).LANCZOS
         img = Image.open(icon_path)
-        img = img.resize(size, resample)
+        if img.size != tuple(size):
+            img = img.resize(size, RESAMPLE)
         print("✅ ICON LOADED:", icon_path.name)
         return ImageTk.PhotoImage(img)
     except Exception as e:
@@ -67,23 +161,15 @@ def load_icon(icon_path: Path, size=(20, 20)):
 
 
 class Tooltip:
-    """Simple tooltip with optional icon."""
+    """Simple tooltip with optional icon (one hidden window, reused on every hover)."""
     def __init__(self, widget, text, icon=None):
         self.widget = widget
         self.text = text
         self.icon = icon
-        self.tw = None
-        widget.bind("<Enter>", self.show)
-        widget.bind("<Leave>", self.hide)
 
-    def show(self, _event=None):
-        if self.tw:
-            return
-        x = self.widget.winfo_pointerx() + 15
-        y = self.widget.winfo_pointery() + 15
-        self.tw = tk.Toplevel(self.widget)
+        self.tw = tk.Toplevel(widget)
+        self.tw.withdraw()
         self.tw.wm_overrideredirect(True)
-        self.tw.wm_geometry(f"+{x}+{y}")
         self.tw.configure(bg="yellow")
 
         frame = tk.Frame(self.tw, bg="yellow")
@@ -97,10 +183,17 @@ class Tooltip:
             bg="yellow", relief="flat", wraplength=260
         ).pack(side="left")
 
+        widget.bind("<Enter>", self.show)
+        widget.bind("<Leave>", self.hide)
+
+    def show(self, _event=None):
+        x = self.widget.winfo_pointerx() + 15
+        y = self.widget.winfo_pointery() + 15
+        self.tw.wm_geometry(f"+{x}+{y}")
+        self.tw.deiconify()
+
     def hide(self, _event=None):
-        if self.tw:
-            self.tw.destroy()
-            self.tw = None
+        self.tw.withdraw()
 
 # ========================= 03. SCROLLABLE CONTAINER ==========================
 class ScrollableFrame(ttk.Frame):
@@ -121,11 +214,25 @@ class ScrollableFrame(ttk.Frame):
         self.frame.bind("<Configure>", self._on_frame_configure)
         self.canvas.bind("<Configure>", self._on_canvas_configure)
 
-        # Mouse wheel
+        # Mouse wheel (only while the pointer is over this scroll area)
+        for w in (self.canvas, self.frame, self.vsb):
+            w.bind("<Enter>", self._bind_mousewheel, add="+")
+            w.bind("<Leave>", self._unbind_mousewheel, add="+")
+
+    def _bind_mousewheel(self, _event=None):
         self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
         self.canvas.bind_all("<Button-4>", self._on_mousewheel_linux)
         self.canvas.bind_all("<Button-5>", self._on_mousewheel_linux)
 
+    def _unbind_mousewheel(self, event):
+        # Moving onto a child widget (or the scrollbar) also fires <Leave>; keep the binding then
+        under = self.winfo_containing(event.x_root, event.y_root)
+        if under is not None and (str(under) == str(self) or str(under).startswith(str(self) + ".")):
+            return
+        self.canvas.unbind_all("<MouseWheel>")
+        self.canvas.unbind_all("<Button-4>")
+        self.canvas.unbind_all("<Button-5>")
+
     def _on_frame_configure(self, _event=None):
         self.canvas.configure(scrollregion=self.canvas.bbox("all"))
 
@@ -152,39 +259,53 @@ class FolderCreatorApp:
 
         self.style = ttk.Style(root)
         self.style.configure("BoldLabel.TLabel", font=("Arial", 11, "bold"))
+        self.style.configure("Sub.TCheckbutton", padding=(22, 0, 0, 0))  # indent subfolder rows
         self._bulk_update = False
+        self._var_to_widget = {}   # str(IntVar) -> subfolder Checkbutton
+
+        # ---------- Background folder creation ----------
+        self._executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+        self._errors = queue.Queue()   # (path, error, reply queue) from workers
+        self._cancel = threading.Event()
+        self._pending = []
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
         # ---------- Icons ----------
         icons_dir = BASE_DIR /"icons"
-        self.icon_name = load_icon(icons_dir / "info_icon_name.png")
-        self.icon_project = load_icon(icons_dir / "info_icon_project.png")
-        self.icon_drive = load_icon(icons_dir / "info_icon_drive.png")
+        icon_files = list_icon_files(icons_dir)
+        if icon_files is None:
+            print("❌ ICONS DIR NOT FOUND:", icons_dir)
+            self.icon_name = self.icon_project = self.icon_drive = None
+        else:
+            self.icon_name = load_icon(icons_dir / "info_icon_name.png", icon_files=icon_files)
+            self.icon_project = load_icon(icons_dir / "info_icon_project.png", icon_files=icon_files)
+            self.icon_drive = load_icon(icons_dir / "info_icon_drive.png", icon_files=icon_files)
 
-        # ---------- Folder tree ----------
-        self.tree = {
-            "Intro & Documentation": [
+        # ---------- Folder tree: (section, layout column (2 cols), subfolders) ----------
+        self.sections = (
+            ("Intro & Documentation", 0, (
                 "General Info", "Project Proposal", "Go-to Person", "Fieldwork Site",
                 "Sample list 4 Lab-Team", "Material List", "Fieldwork Protocol-Planning-Permission",
                 "Images", "Meetings",
-            ],
-            "Lab Measurements": [
+            )),
+            ("Lab Measurements", 1, (
                 "TOC", "pH", "CN", "ICP-MS", "CFA", "Aqualog", "Raw Data Preparation", "Misc-Lab Data",
-            ],
-            "Field Measurements": [
+            )),
+            ("Field Measurements", 0, (
                 "Meteorology", "Hydrology", "Vegetation", "Soil",
-            ],
-            "Geodata": [
+            )),
+            ("Geodata", 0, (
                 "Coordinates", "Maps", "Satellite Images",
-            ],
-            "Finance & Administration": [
+            )),
+            ("Finance & Administration", 1, (
                 "Approvals & Guidelines", "Expenditure Reports", "Account Overview", "Bank Statements",
                 "Personnel-Assistants & Staff", "Contracts - Service & Transfer",
                 "Travel Expense Reports", "Reimbursement Claims", "Purchase Orders",
-            ],
-            "Outcome": [
+            )),
+            ("Outcome", 0, (
                 "Master Files", "Presentations", "Publications", "Reports", "Logo", "Other Outputs",
-            ],
-        }
+            )),
+        )
 
         # ---------- Option A: sub-subfolders ----------
         self.sub_sub_map = {
@@ -199,33 +320,16 @@ class FolderCreatorApp:
                 "Soil": ["Soil Manual", "Soil Instrument"],
             },
         }
-
-        # ---------- Layout order (2 cols) ----------
-        self.layout_order = [
-            ("Intro & Documentation", 0),
-            ("Lab Measurements", 1),
-            ("Field Measurements", 0),
-            ("Geodata", 0),
-            ("Finance & Administration", 1),
-            ("Outcome", 0),
-        ]
+        # (section, subfolder) -> children, for a single lookup per subfolder
+        self._flat_children = {
+            (sect, sub): tuple(children)
+            for sect, subs in self.sub_sub_map.items()
+            for sub, children in subs.items()
+        }
 
         # Build UI
         self._build_ui()
 
-    # ====================== 05.Utilities ======================
-    def _find_widget_for_var(self, var: IntVar, container: tk.Misc):
-        for child in container.winfo_children():
-            try:
-                if isinstance(child, Checkbutton) and child.cget("variable") == str(var):
-                    return child
-            except Exception:
-                pass
-            res = self._find_widget_for_var(var, child)
-            if res is not None:
-                return res
-        return None
-
     # ====================== 06.Build UI =======================
     def _build_ui(self):
         scroll = ScrollableFrame(self.root)
@@ -265,72 +369,115 @@ class FolderCreatorApp:
         self.entry_drive = ttk.Entry(main, width=40, font=("Arial", 11))
         self.entry_drive.grid(row=2, column=1, padx=8, pady=6, sticky="we")
 
-        # Sections
+        # Inline validation status (missing fields)
+        self.status = ttk.Label(main, text="", foreground="red")
+        self.status.grid(row=3, column=0, columnspan=2, sticky="w", padx=8)
+
+        # Sections: one frame per column, one frame per section inside it, so a
+        # section growing (lazy subfolders) never shifts the other column
         start_row = 4
-        col_rows = {0: start_row, 1: start_row}
+        col_frames = {}
+        col_rows = {0: 0, 1: 0}
+        for col in col_rows:
+            col_frames[col] = ttk.Frame(main)
+            col_frames[col].grid(row=start_row, column=col, sticky="nwe")
 
         self.section_vars = {}
         self.sub_vars = {}
         self.select_all_vars = {}
         self.select_all_widgets = {}
+        self._on_subs = {}   # section -> names of ticked subfolder vars
+        self._subs_built = {}   # subfolder checkbuttons are created on first enable
+        self._sub_slots = {}    # section -> (section frame, subfolders)
+
+        # Grid all section widgets in one pass after construction, with
+        # propagation off so Tk does not re-solve the layout per widget
+        main.grid_propagate(False)
+        placements = []
+
+        for section, col, subs in self.sections:
+            sect_frame = ttk.Frame(col_frames[col])
+            placements.append((sect_frame, dict(row=col_rows[col], column=0, sticky="we")))
+            col_rows[col] += 1
 
-        for section, col in self.layout_order:
-            svar = IntVar(value=0)
+            svar = tk.IntVar(value=0)
             self.section_vars[section] = svar
-            Checkbutton(main, text=section, variable=svar)\
-                .grid(row=col_rows[col], column=col, sticky="w", padx=8, pady=(12, 2))
-            col_rows[col] += 1
+            placements.append((ttk.Checkbutton(sect_frame, text=section, variable=svar),
+                               dict(row=0, column=0, sticky="w", padx=8, pady=(12, 2))))
 
-            sel_all_var = IntVar(value=0)
+            sel_all_var = tk.IntVar(value=0)
             self.select_all_vars[section] = sel_all_var
-            sel_all_cb = Checkbutton(main, text="    Select all subfolders", variable=sel_all_var, state=tk.DISABLED)
+            sel_all_cb = ttk.Checkbutton(sect_frame, text="Select all subfolders", variable=sel_all_var,
+                                         style="Sub.TCheckbutton", state=tk.DISABLED)
             self.select_all_widgets[section] = sel_all_cb
-            sel_all_cb.grid(row=col_rows[col], column=col, sticky="w", padx=22, pady=(0, 2))
-            col_rows[col] += 1
+            placements.append((sel_all_cb, dict(row=1, column=0, sticky="w", padx=22, pady=(0, 2))))
 
+            # Subfolder rows are built in build_subs, below "Select all" in this frame
             self.sub_vars[section] = []
-            for sub in self.tree[section]:
-                v = IntVar(value=0)
-                self.sub_vars[section].append((sub, v))
-                Checkbutton(main, text=f"    {sub}", variable=v, state=tk.DISABLED)\
-                    .grid(row=col_rows[col], column=col, sticky="w", padx=22)
-                col_rows[col] += 1
+            self._on_subs[section] = set()
+            self._subs_built[section] = False
+            self._sub_slots[section] = (sect_frame, subs)
+
+            def build_subs(sect=section):
+                frame, subs = self._sub_slots[sect]
+                for i, sub in enumerate(subs, start=2):
+                    v = tk.IntVar(value=0)
+                    self.sub_vars[sect].append((sub, v))
+                    cb = ttk.Checkbutton(frame, text=sub, variable=v, style="Sub.TCheckbutton", state=tk.DISABLED)
+                    cb.grid(row=i, column=0, sticky="w", padx=22)
+                    self._var_to_widget[str(v)] = cb
+                    v.trace_add("write", lambda *_a, s=sect, v=v: update_select_all(v, sect=s))
+                self._subs_built[sect] = True
 
             # Traces
             def set_children_enabled(enabled, sect=section):
+                if self._bulk_update:
+                    return
+                if enabled and not self._subs_built[sect]:
+                    build_subs(sect=sect)
                 self.select_all_widgets[sect].configure(state=(tk.NORMAL if enabled else tk.DISABLED))
                 for _, v in self.sub_vars[sect]:
-                    w = self._find_widget_for_var(v, main)
-                    if w:
-                        w.configure(state=(tk.NORMAL if enabled else tk.DISABLED))
+                    self._var_to_widget[str(v)].configure(state=(tk.NORMAL if enabled else tk.DISABLED))
 
-            def update_select_all(sect=section):
+            def update_select_all(var, sect=section):
                 if self._bulk_update:
                     return
-                all_on = all(v.get() == 1 for _, v in self.sub_vars[sect])
+                on = self._on_subs[sect]
+                if var.get():
+                    on.add(str(var))
+                else:
+                    on.discard(str(var))
+                all_on = len(on) == len(self.sub_vars[sect])
                 if self.select_all_vars[sect].get() != int(all_on):
                     self._bulk_update = True
                     self.select_all_vars[sect].set(int(all_on))
                     self._bulk_update = False
 
             def toggle_all_children(to_value, sect=section):
+                was_bulk = self._bulk_update
                 self._bulk_update = True
                 for _, v in self.sub_vars[sect]:
                     v.set(to_value)
-                self._bulk_update = False
+                self._on_subs[sect] = {str(v) for _, v in self.sub_vars[sect]} if to_value else set()
+                self._bulk_update = was_bulk
 
             svar.trace_add("write", lambda *_a, s=section, sv=svar: set_children_enabled(bool(sv.get()), sect=s))
             self.select_all_vars[section].trace_add("write", lambda *_a, s=section: toggle_all_children(self.select_all_vars[s].get(), sect=s))
-            for _, v in self.sub_vars[section]:
-                v.trace_add("write", lambda *_a, s=section: update_select_all(sect=s))
+
+        for widget, opts in placements:
+            widget.grid(**opts)
 
         # Create button (styled, centered)
-        bottom_row = max(col_rows.values()) + 2
-        tk.Button(
+        bottom_row = start_row + 1
+        self.btn_create = tk.Button(
             main, text="Create Folders", command=self.create_folders,
             bg="#4CAF50", fg="white", font=("Arial", 11, "bold"),
             padx=15, pady=6, relief="raised", bd=3, cursor="hand2"
-        ).grid(row=bottom_row, column=0, columnspan=2, pady=20)
+        )
+        self.btn_create.grid(row=bottom_row, column=0, columnspan=2, pady=20)
+
+        main.grid_propagate(True)
+        main.update_idletasks()
 
     # ====================== 07. Reset form ======================
     def reset_form(self):
@@ -339,13 +486,22 @@ class FolderCreatorApp:
         # self.entry_drive.delete(0, tk.END)  # uncomment to clear drive too
         self.entry_name.focus_set()
 
+        # Traces are skipped while resetting; widget states are set in one pass below
+        self._bulk_update = True
         for section, svar in self.section_vars.items():
             svar.set(0)
         for section, subs in self.sub_vars.items():
             for _, v in subs:
                 v.set(0)
+            self._on_subs[section] = set()
         for section, selvar in self.select_all_vars.items():
             selvar.set(0)
+        self._bulk_update = False
+
+        for w in self.select_all_widgets.values():
+            w.configure(state=tk.DISABLED)
+        for w in self._var_to_widget.values():
+            w.configure(state=tk.DISABLED)
 
     # ====================== 08. Create folders =================
     def create_folders(self):
@@ -360,37 +516,150 @@ class FolderCreatorApp:
         if not messagebox.askyesno("Confirmation", f"Create folder tree under:\n{main_folder}\n\nProceed?"):
             return
 
-        # Main (keeps full name)
-        create_folder(main_folder)
+        # Only leaf folders need a mkdir: parents=True materializes the ancestors.
+        # Each section subtree is independent, so it gets its own worker.
+        subtrees = {}
+        for leaf in self._collect_leaf_paths(main_folder, project_code, acronym):
+            top = leaf.relative_to(main_folder).parts[:1]
+            subtrees.setdefault(top, []).append(leaf)
+
+        self.btn_create.configure(state=tk.DISABLED)
+        self._cancel.clear()
+        self._pending = [self._executor.submit(self._create_subtree, main_folder, leaves)
+                         for leaves in subtrees.values()]
+        self.root.after(POLL_MS, self._poll_creation, main_folder)
+
+    def _create_subtree(self, main_folder: Path, leaves):
+        """Worker thread: create the given leaf folders in order; return the created ones."""
+        created = []
+        dir_fds = None
+        if USE_DIR_FD:
+            try:
+                main_folder.mkdir(parents=True, exist_ok=True)
+                dir_fds = {main_folder: os.open(main_folder, DIR_OPEN_FLAGS)}
+            except OSError:
+                dir_fds = None  # fall back to full paths; errors are reported per leaf
+        try:
+            for leaf in leaves:
+                if self._cancel.is_set():
+                    break
+                if not create_folder(leaf, ask_continue=self._ask_from_worker,
+                                     dir_fds=dir_fds, created=created):
+                    self._cancel.set()
+                    break
+            return created
+        finally:
+            for fd in (dir_fds or {}).values():
+                os.close(fd)
+
+    def _ask_from_worker(self, path: Path, error: OSError) -> bool:
+        """Worker thread: hand the error prompt to the Tk thread and wait for the answer."""
+        reply = queue.Queue(maxsize=1)
+        self._errors.put((path, error, reply))
+        # Only the Tk thread answers; stop waiting if the run was cancelled (window closed)
+        while not self._cancel.is_set():
+            try:
+                return reply.get(timeout=POLL_MS / 1000)
+            except queue.Empty:
+                pass
+        return False
 
-        # Sections & subfolders (Code-only prefixes)
-        for section, svar in self.section_vars.items():
-            if not svar.get():
-                continue
+    def _on_close(self):
+        """Stop any running workers before tearing down the window."""
+        self._cancel.set()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
 
-            # Section folder now uses Code only
-            section_path = main_folder / f"{project_code}-{acronym} {section}"
-            create_folder(section_path)
+    def _poll_creation(self, main_folder: Path):
+        """Tk thread: answer queued worker errors and finish once all workers are done."""
+        while True:
+            try:
+                path, error, reply = self._errors.get_nowait()
+            except queue.Empty:
+                break
+            proceed = not self._cancel.is_set() and ask_continue_on_error(path, error)
+            if not proceed:
+                self._cancel.set()
+            reply.put(proceed)
+
+        if not all(f.done() for f in self._pending):
+            self.root.after(POLL_MS, self._poll_creation, main_folder)
+            return
 
-            for sub, v in self.sub_vars[section]:
-                if not v.get():
-                    continue
+        pending, self._pending = self._pending, []
+        self.btn_create.configure(state=tk.NORMAL)
 
-                # Subfolder uses Code only
-                sub_path = section_path / f"{project_code}-{acronym} {sub}"
-                create_folder(sub_path)
+        created = []
+        for f in pending:
+            try:
+                created.extend(f.result())
+            except Exception as e:  # unexpected worker failure; OSErrors are prompted per folder
+                print(f"Error creating folders under: {main_folder}\n{e}")
+                if self._cancel.is_set() or not ask_continue_on_error(main_folder, e):
+                    self._cancel.set()
+        if self._cancel.is_set():
+            self._executor.shutdown(wait=False)
+            sys.exit(1)
+        self._on_creation_done(main_folder, created)
 
-                # Option A: extra children (also prefixed with Code only)
-                extra_children = self.sub_sub_map.get(section, {}).get(sub, [])
-                for child in extra_children:
-                    create_folder(sub_path / f"{project_code}-{acronym} {child}")
+    def _on_creation_done(self, main_folder: Path, created):
+        """Single dialog: list the created folders, then Create another (Enter) or Exit."""
+        dlg = tk.Toplevel(self.root)
+        dlg.title("Success")
+        dlg.transient(self.root)
 
-        messagebox.showinfo("Success", f"Folders created under:\n{main_folder}")
-        do_more = messagebox.askyesno("Continue?", "Do you want to create another folder set?\n\nYes = Continue   |   No = Exit")
-        if do_more:
+        ttk.Label(dlg, text=f"Folders created under:\n{main_folder}", style="BoldLabel.TLabel")\
+            .pack(anchor="w", padx=10, pady=(10, 6))
+
+        lines = sorted(str(p.relative_to(main_folder)) for p in created if p != main_folder)
+        text = tk.Text(dlg, width=80, height=min(max(len(lines), 1), 20), wrap="none")
+        text.insert("1.0", "\n".join(lines))
+        text.configure(state=tk.DISABLED)
+        text.pack(fill="both", expand=True, padx=10)
+
+        def create_another(_event=None):
+            dlg.destroy()
             self.reset_form()
-        else:
-            self.root.destroy()
+
+        buttons = ttk.Frame(dlg)
+        buttons.pack(pady=10)
+        btn_again = ttk.Button(buttons, text="Create another", command=create_another)
+        btn_again.pack(side="left", padx=5)
+        ttk.Button(buttons, text="Exit", command=self._on_close).pack(side="left", padx=5)
+
+        btn_again.focus_set()
+        dlg.bind("<Return>", create_another)
+        dlg.protocol("WM_DELETE_WINDOW", create_another)
+        dlg.wait_visibility()
+        dlg.grab_set()
+
+    def _collect_leaf_paths(self, main_folder: Path, project_code: str, acronym: str):
+        """Return the minimal, deduplicated list of folders to mkdir (deepest first)."""
+        paths = {main_folder}
+
+        # Same Code-only prefix for every section, subfolder and child
+        prefix = f"{project_code}-{acronym} "
+        selected_sections = [s for s, v in self.section_vars.items() if v.get()]
+
+        for section in selected_sections:
+            section_path = main_folder / (prefix + section)
+            paths.add(section_path)
+
+            selected_subs = [sub for sub, v in self.sub_vars[section] if v.get()]
+            for sub in selected_subs:
+                sub_path = section_path / (prefix + sub)
+                paths.add(sub_path)
+
+                # Option A: extra children
+                for child in self._flat_children.get((section, sub), ()):
+                    paths.add(sub_path / (prefix + child))
+
+        # Any path that is an ancestor of another one is covered by parents=True
+        ancestors = set()
+        for path in paths:
+            ancestors.update(path.parents)
+        leaves = paths - ancestors
+        return sorted(leaves, key=lambda p: (-len(str(p)), str(p)))
 
     # ====================== 09. Validation =====================
     def _validate_inputs(self):
@@ -398,37 +667,22 @@ class FolderCreatorApp:
         meta = self.entry_meta.get().strip()   # expects "YYYY-Person" (optional)
         drive = self.entry_drive.get().strip() # expects single letter only
 
-    # ====================== 10. Required fields
-        missing = []
-        if not name:
-            missing.append("Code & Project Acronym")
-        if not meta:
-            missing.append("Start Year & Person")
-        if not drive:
-            missing.append("Drive/Path")
+    # ====================== 10. Required fields (shown inline, no dialog)
+        required = (
+            ("Code & Project Acronym", name, self.entry_name),
+            ("Start Year & Person", meta, self.entry_meta),
+            ("Drive/Path", drive, self.entry_drive),
+        )
+        missing = [(label, entry) for label, value, entry in required if not value]
 
         if missing:
-            msg = (
-                "The following required fields are empty:\n"
-                f" - " + "\n - ".join(missing) +
-                "\n\nDo you want to continue filling the form?\n"
-                "Yes = keep editing   |   No = exit"
-            )
-            keep_editing = messagebox.askyesno("Incomplete form", msg)
-            if keep_editing:
-                if "Code & Project Acronym" in missing:
-                    self.entry_name.focus_set()
-                elif "Start Year & Person" in missing:
-                    self.entry_meta.focus_set()     
-                else:
-                    self.entry_drive.focus_set()
-                return None
-            else:
-                self.root.destroy()
-                return None
+            self.status["text"] = "Required: " + ", ".join(label for label, _ in missing)
+            missing[0][1].focus_set()
+            return None
+        self.status["text"] = ""
 
         # ---------- Validate name: Code-Acronym ----------
-        m_name = re.match(r"^([A-Za-z])\-([A-Za-z0-9][A-Za-z0-9\- _]*)$", name)
+        m_name = _NAME_RE.match(name)
         if not m_name:
             messagebox.showerror("Invalid Name", "Name must be: Code-Acronym (e.g., A-CABCAR)")
             self.entry_name.focus_set()
@@ -438,7 +692,7 @@ class FolderCreatorApp:
 
         # ---------- Validate meta if provided: must be YYYY-Person
 
-        m_meta = re.match(r"^(\d{4})\-([A-Za-zÀ-ÖØ-öø-ÿ][A-Za-zÀ-ÖØ-öø-ÿ\s\-\.\']*)$", meta)
+        m_meta = _META_RE.match(meta)
         if not m_meta:
             messagebox.showerror("Invalid format", "Start Year & Person must look like: 2025-Thomas")
             self.entry_meta.focus_set()
@@ -447,7 +701,7 @@ class FolderCreatorApp:
         person = m_meta.group(2).strip()
 
         # ---------- Validate drive: single letter A-Z ----------
-        if not re.fullmatch(r"^[A-Za-z]$", drive):
+        if not _DRIVE_RE.fullmatch(drive):
             messagebox.showerror("Invalid Drive", "Drive must be ONE letter (A–Z), e.g., F")
             self.entry_drive.focus_set()
             return None